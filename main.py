@@ -2,11 +2,17 @@
 The main function that prepares a listing for each noia file
 """
 import os
+import sys
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from progressbar import ProgressWithLogging
 
-from parse_bible import parse_noia_bible
+from parse_bible import (
+    REQUIRED_TAGS,
+    parse_noia_bible,
+    validate_noia_bible,
+)
 from custom_text_format import custom_toml_format, tsv_store_bible
 from sqlite_store import sqlite_store_bible
 
@@ -100,6 +106,12 @@ if __name__ == "__main__":
             default="json",
             help="The output format of the files to store",
         )
+        parser.add_argument(
+            "--check",
+            "-c",
+            action="store_true",
+            help="Only validate the *.noia files in parallel; write nothing.",
+        )
         return parser.parse_args()
 
     def store_json(data, file_name):
@@ -117,6 +129,37 @@ if __name__ == "__main__":
     args = cli_args()
     source = args.input
     extn = args.format
+
+    if args.check:
+        assert os.path.isdir(source), ERRMSG_DIR_NOT_FOUND
+        check_list = sorted(
+            f"{source}/{name}" for name in os.listdir(source)
+            if name.endswith(".noia")
+        )
+        error_count = 0
+        with ProcessPoolExecutor() as executor:
+            jobs = [
+                executor.submit(validate_noia_bible, path)
+                for path in check_list
+            ]
+            progress_bar = ProgressWithLogging()
+            for path, job in progress_bar.run_progress(
+                list(zip(check_list, jobs))
+            ):
+                try:
+                    errors = job.result()
+                except Exception as err:  # pylint: disable=broad-except
+                    errors = [f"{path}: Check failed: {err}"]
+                for error in errors:
+                    progress_bar.channel.put(error)
+                if len(errors) == 0:
+                    progress_bar.channel.put(f"{path} OK")
+                error_count += len(errors)
+        LINE = f"\n{len(check_list)} files checked, "
+        LINE += f"{error_count} errors found\n"
+        print(LINE)
+        sys.exit(1 if error_count > 0 else 0)
+
     dest = f"{args.output}/{extn}"
     store_fn = store_json
     if extn == "sqlite":
@@ -152,13 +195,16 @@ if __name__ == "__main__":
         store_fn(fulldata, FILE_PATH)
 
         size_dest = os.path.getsize(FILE_PATH)
+        bible_name, bible_name_en, language, language_en = (
+            metadata[tag] for tag in REQUIRED_TAGS
+        )
         bible_listing.append(
             BibleListingItem(
                 filename=filename,
-                bible_name_en=metadata['Bible Name English'],
-                bible_name=metadata['Bible Name'],
-                language_en=metadata['Bible Language English'],
-                language=metadata['Bible Language'],
+                bible_name_en=bible_name_en,
+                bible_name=bible_name,
+                language_en=language_en,
+                language=language,
                 size=size_dest,
             )
         )
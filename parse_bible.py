@@ -307,3 +307,99 @@ def parse_noia_bible(path: str) -> tuple[dict, dict, dict]:
 
         cur_context.handle_eof()
         return cur_context.metadata, cur_context.listing, cur_context.content
+
+
+REQUIRED_TAGS = (
+    "Bible Name",
+    "Bible Name English",
+    "Bible Language",
+    "Bible Language English",
+)
+"""
+The metadata tags that every `.noia` file must declare with a non-empty
+value for the listing, in the order `main.py` unpacks them
+"""
+
+
+def validate_noia_bible(path: str) -> list[str]:
+    """
+    Scans a single *.noia bible file without building its content, and
+    collects every problem found instead of stopping at the first one
+
+    Args:
+                    path (str): The path of the noia file to validate
+
+    Returns:
+                    list[str]: A list of error messages, one per problem.
+                    Invalid lines, duplicate verses, out-of-order chapters
+                    and missing or empty required tags are reported.
+                    An empty list means the file is valid.
+    """
+    if not os.path.isfile(path):
+        return [f"{path}: invalid path for file"]
+
+    errors: list[str] = []
+    tags: dict[str, str] = {}
+    seen_verses: set[tuple[int, int, int]] = set()
+    header_book_no = 0
+    verse_book_no = 0
+    book_checked = False
+    current_chapter_no = 0
+    try:
+        with open(path, "r", encoding='utf-8') as file:
+            for line_no, line in enumerate(file, start=1):
+                try:
+                    line_type, data = parse_line(line)
+                except ValueError:
+                    line_type, data = NoiaLineType.INVALID, line.strip()
+
+                if line_type == NoiaLineType.INVALID:
+                    errors.append(f"{path}:{line_no}: Invalid line: {data}")
+
+                elif line_type == NoiaLineType.BOOK_START_LINE:
+                    header_book_no = data.book_id
+                    book_checked = False
+
+                elif line_type == NoiaLineType.VERSE_LINE:
+                    if data.book_id != verse_book_no:
+                        verse_book_no = data.book_id
+                        book_checked = False
+                        current_chapter_no = 0
+                    if not book_checked:
+                        book_checked = True
+                        if verse_book_no != header_book_no:
+                            errors.append(
+                                f"{path}:{line_no}: Verse of book "
+                                f"{verse_book_no} under header of book "
+                                f"{header_book_no}"
+                            )
+                    if data.chapter_id < current_chapter_no:
+                        errors.append(
+                            f"{path}:{line_no}: Out-of-order chapter "
+                            f"{data.chapter_id} after chapter "
+                            f"{current_chapter_no} in book {verse_book_no}"
+                        )
+                    current_chapter_no = data.chapter_id
+                    verse_key = (verse_book_no, data.chapter_id, data.verse_id)
+                    if verse_key in seen_verses:
+                        errors.append(
+                            f"{path}:{line_no}: Duplicate verse "
+                            f"{data.chapter_id}:{data.verse_id}"
+                            f" in book {verse_book_no}"
+                        )
+                    seen_verses.add(verse_key)
+
+                elif line_type == NoiaLineType.COMMENT_LINE and ":" in data:
+                    index_val = data.index(":")
+                    key = data[:index_val].strip()
+                    tags[key] = data[index_val + 1:].strip()
+    except (UnicodeDecodeError, OSError) as err:
+        errors.append(f"{path}: Unreadable file: {err}")
+        return errors
+
+    for tag in REQUIRED_TAGS:
+        if tag not in tags:
+            errors.append(f"{path}: Missing tag: {tag}")
+        elif len(tags[tag]) == 0:
+            errors.append(f"{path}: Empty tag: {tag}")
+    return errors